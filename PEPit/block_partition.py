@@ -13,6 +13,9 @@ class BlockPartition(object):
                             Keys are :class:`Point` objects.
                             Values are lists of :class:`Point` objects corresponding to the decompositions of the key in blocks.
         list_of_constraints (list): The list of :class:`Constraint` objects associated with this :class:`BlockPartition`.
+        _nb_points_in_partition_constraints (int): The number of decomposed points `list_of_constraints`
+                                                   was computed from.
+                                                   Set to None until the partition constraints are first generated.
         d (int): encodes the number of blocks (:math:`d \\geq 1`).
         counter (int): counts the number of :class:`BlockPartition` objects.
 
@@ -49,6 +52,7 @@ class BlockPartition(object):
         # Store attributes
         self.d = d
         self.list_of_constraints = list()
+        self._nb_points_in_partition_constraints = None
         self.blocks_dict = dict()
         self.counter = BlockPartition.counter
 
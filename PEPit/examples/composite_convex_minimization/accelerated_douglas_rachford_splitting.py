@@ -1,10 +1,12 @@
+import numpy as np
+
 from PEPit import PEP
 from PEPit.functions import SmoothStronglyConvexFunction
 from PEPit.functions import ConvexFunction
 from PEPit.primitive_steps import proximal_step
 
 
-def wc_accelerated_douglas_rachford_splitting(mu, L, alpha, n, verbose=1):
+def wc_accelerated_douglas_rachford_splitting(mu, L, alpha, n, verbose=1, solver=None):
     """
     Consider the composite convex minimization problem
 
@@ -70,6 +72,9 @@ def wc_accelerated_douglas_rachford_splitting(mu, L, alpha, n, verbose=1):
                         - 0: This example's output.
                         - 1: This example's output + PEPit information.
                         - 2: This example's output + PEPit information + CVXPY details.
+        solver (str, optional): the CVXPY solver used to solve the PEP.
+                                Set to "auto" to let PEPit choose it depending on the size of the PEP,
+                                or to None (default) to let CVXPY choose it.
 
     Returns:
         pepit_tau (float): worst-case value.
@@ -125,12 +130,14 @@ def wc_accelerated_douglas_rachford_splitting(mu, L, alpha, n, verbose=1):
     x = [x0 for _ in range(n)]
     w = [x0 for _ in range(n + 1)]
     u = [x0 for _ in range(n + 1)]
+    # Precompute the momentum coefficients of all the iterations as Python floats
+    momentum = ((np.arange(n) - 1) / (np.arange(n) + 2)).tolist()
     for i in range(n):
         x[i], _, _ = proximal_step(u[i], func2, alpha)
         y, _, fy = proximal_step(2 * x[i] - u[i], func1, alpha)
         w[i + 1] = u[i] + theta * (y - x[i])
         if i >= 1:
-            u[i + 1] = w[i + 1] + (i - 1) / (i + 2) * (w[i + 1] - w[i])
+            u[i + 1] = w[i + 1] + momentum[i] * (w[i + 1] - w[i])
         else:
             u[i + 1] = w[i + 1]
 
@@ -139,7 +146,7 @@ def wc_accelerated_douglas_rachford_splitting(mu, L, alpha, n, verbose=1):
 
     # Solve the PEP
     pepit_verbose = max(verbose, 0)
-    pepit_tau = problem.solve(verbose=pepit_verbose)
+    pepit_tau = problem.solve(verbose=pepit_verbose, solver=solver)
 
     # Compute theoretical guarantee (for comparison)
     if alpha < 1 / L:
@@ -1,10 +1,12 @@
+import numpy as np
+
 from PEPit import PEP
 from PEPit.functions import SmoothStronglyConvexFunction
 from PEPit.functions import ConvexFunction
 from PEPit.primitive_steps import proximal_step
 
 
-def wc_accelerated_proximal_gradient(mu, L, n, verbose=1):
+def wc_accelerated_proximal_gradient(mu, L, n, verbose=1, solver=None):
     """
     Consider the composite convex minimization problem
 
@@ -61,6 +63,9 @@ def wc_accelerated_proximal_gradient(mu, L, n, verbose=1):
                         - 0: This example's output.
                         - 1: This example's output + PEPit information.
                         - 2: This example's output + PEPit information + CVXPY details.
+        solver (str, optional): the CVXPY solver used to solve the PEP.
+                                Set to "auto" to let PEPit choose it depending on the size of the PEP,
+                                or to None (default) to let CVXPY choose it.
 
     Returns:
         pepit_tau (float): worst-case value.
@@ -108,19 +113,22 @@ def wc_accelerated_proximal_gradient(mu, L, n, verbose=1):
     problem.set_initial_condition((x0 - xs) ** 2 <= 1)
 
     # Compute n steps of the accelerated proximal gradient method starting from x0
+    gamma = 1 / L
+    # Precompute the momentum coefficients of all the iterations as Python floats
+    momentum = (np.arange(n) / (np.arange(n) + 3)).tolist()
     x_new = x0
     y = x0
     for i in range(n):
         x_old = x_new
-        x_new, _, hx_new = proximal_step(y - 1 / L * f.gradient(y), h, 1 / L)
-        y = x_new + i / (i + 3) * (x_new - x_old)
+        x_new, _, hx_new = proximal_step(y - gamma * f.gradient(y), h, gamma)
+        y = x_new + momentum[i] * (x_new - x_old)
 
     # Set the performance metric to the function value accuracy
     problem.set_performance_metric((f(x_new) + hx_new) - Fs)
 
     # Solve the PEP
     pepit_verbose = max(verbose, 0)
-    pepit_tau = problem.solve(verbose=pepit_verbose)
+    pepit_tau = problem.solve(verbose=pepit_verbose, solver=solver)
 
     # Compute theoretical guarantee (for comparison)
     if mu == 0:
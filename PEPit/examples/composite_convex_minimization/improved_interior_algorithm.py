@@ -115,6 +115,9 @@ def wc_improved_interior_algorithm(L, mu, c, lam, n, verbose=1):
     gh0, h0 = h.oracle(x0)
     g10, f10 = func1.oracle(x0)
 
+    # Define the mirror map of the Bregman gradient steps once for all the iterations
+    mirror_map = h + func2
+
     # Compute n steps of the Improved Interior Algorithm starting from x0
     x = x0
     z = x0
@@ -127,7 +130,7 @@ def wc_improved_interior_algorithm(L, mu, c, lam, n, verbose=1):
         y = (1 - alphak) * x + alphak * z
         if i >= 1:
             g, f = func1.oracle(y)
-        z, _, _ = bregman_gradient_step(g, gh, h + func2, alphak / ck)
+        z, _, _ = bregman_gradient_step(g, gh, mirror_map, alphak / ck)
         x = (1 - alphak) * x + alphak * z
         gh, _ = h.oracle(z)
 
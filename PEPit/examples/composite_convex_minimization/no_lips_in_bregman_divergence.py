@@ -116,13 +116,16 @@ def wc_no_lips_in_bregman_divergence(L, gamma, n, verbose=1):
     # Set the initial constraint that is the Bregman distance between x0 and x^*
     problem.set_initial_condition(hs - h0 - gh0 * (xs - x0) <= 1)
 
+    # Define the mirror map of the Bregman gradient steps once for all the iterations
+    mirror_map = func2 + h
+
     # Compute n steps of the NoLips starting from x0
     x1, x2 = x0, x0
     gfx = gf0
     ghx = gh0
     hx1, hx2 = h0, h0
     for i in range(n):
-        x2, _, _ = bregman_gradient_step(gfx, ghx, func2 + h, gamma)
+        x2, _, _ = bregman_gradient_step(gfx, ghx, mirror_map, gamma)
         gfx, _ = func1.oracle(x2)
         ghx, hx2 = h.oracle(x2)
         Dhx = hx1 - hx2 - ghx * (x1 - x2)
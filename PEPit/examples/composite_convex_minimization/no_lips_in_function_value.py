@@ -118,12 +118,15 @@ def wc_no_lips_in_function_value(L, gamma, n, verbose=1):
     # Set the initial constraint that is the Bregman distance between x0 and x^*
     problem.set_initial_condition(hs - h0 - gh0 * (xs - x0) <= 1)
 
+    # Define the mirror map of the Bregman gradient steps once for all the iterations
+    mirror_map = func2 + h
+
     # Compute n steps of the NoLips starting from x0
     gfx = gf0
     ffx = f0
     ghx = gh0
     for i in range(n):
-        x, _, _ = bregman_gradient_step(gfx, ghx, func2 + h, gamma)
+        x, _, _ = bregman_gradient_step(gfx, ghx, mirror_map, gamma)
         gfx, ffx = func1.oracle(x)
         gdx = d.gradient(x)
         ghx = (gdx + gfx) / L
@@ -3,7 +3,7 @@ from PEPit.functions import ConvexIndicatorFunction
 from PEPit.primitive_steps import proximal_step
 
 
-def wc_alternate_projections(n, verbose=1):
+def wc_alternate_projections(n, verbose=1, solver=None):
     """
     Consider the convex feasibility problem:
 
@@ -51,6 +51,9 @@ def wc_alternate_projections(n, verbose=1):
                         - 0: This example's output.
                         - 1: This example's output + PEPit information.
                         - 2: This example's output + PEPit information + CVXPY details.
+        solver (str, optional): the CVXPY solver used to solve the PEP.
+                                Set to "auto" to let PEPit choose it depending on the size of the PEP,
+                                or to None (default) to let CVXPY choose it.
 
     Returns:
         pepit_tau (float): worst-case value
@@ -109,7 +112,7 @@ def wc_alternate_projections(n, verbose=1):
 
     # Solve the PEP
     pepit_verbose = max(verbose, 0)
-    pepit_tau = problem.solve(verbose=pepit_verbose, dimension_reduction_heuristic="logdet1")
+    pepit_tau = problem.solve(verbose=pepit_verbose, dimension_reduction_heuristic="logdet1", solver=solver)
     theoretical_tau = None
 
     # Print conclusion if required
@@ -79,8 +79,8 @@ def wc_frank_wolfe(L, D, n, verbose=1):
         (PEPit) Setting up the problem: interpolation conditions for 2 function(s)
                          function 1 : Adding 132 scalar constraint(s) ...
                          function 1 : 132 scalar constraint(s) added
-                         function 2 : Adding 325 scalar constraint(s) ...
-                         function 2 : 325 scalar constraint(s) added
+                         function 2 : Adding 247 scalar constraint(s) ...
+                         function 2 : 247 scalar constraint(s) added
         (PEPit) Compiling SDP
         (PEPit) Calling SDP solver
         (PEPit) Solver status: optimal (solver: SCS); optimal value: 0.07830185202143693
@@ -78,8 +78,8 @@ def wc_no_lips_1(L, gamma, n, verbose=1):
                          function 1 : 30 scalar constraint(s) added
                          function 2 : Adding 30 scalar constraint(s) ...
                          function 2 : 30 scalar constraint(s) added
-                         function 3 : Adding 49 scalar constraint(s) ...
-                         function 3 : 49 scalar constraint(s) added
+                         function 3 : Adding 47 scalar constraint(s) ...
+                         function 3 : 47 scalar constraint(s) added
         (PEPit) Compiling SDP
         (PEPit) Calling SDP solver
         (PEPit) Solver status: optimal (solver: SCS); optimal value: 0.20000306821054706
@@ -96,7 +96,7 @@ def wc_no_lips_1(L, gamma, n, verbose=1):
     d1 = problem.declare_function(ConvexFunction, reuse_gradient=True)
     d2 = problem.declare_function(ConvexFunction, reuse_gradient=True)
     func1 = (d2 - d1) / 2
-    h = (d1 + d2) / 2 / L
+    h = (d1 + d2) / (2 * L)
     func2 = problem.declare_function(ConvexIndicatorFunction, D=np.inf)
 
     # Define the function to optimize as the sum of func1 and func2
@@ -108,13 +108,16 @@ def wc_no_lips_1(L, gamma, n, verbose=1):
     gf0, f0 = func1.oracle(x0)
     _, F0 = func.oracle(x0)
 
+    # Define the mirror map of the Bregman gradient steps once for all the iterations
+    mirror_map = func2 + h
+
     # Compute n steps of the NoLips starting from x0
     xx = [x0 for _ in range(n + 1)]
     gfx = gf0
     ghx = [gh0 for _ in range(n + 1)]
     hx = [h0 for _ in range(n + 1)]
     for i in range(n):
-        xx[i + 1], _, _ = bregman_gradient_step(gfx, ghx[i], func2 + h, gamma)
+        xx[i + 1], _, _ = bregman_gradient_step(gfx, ghx[i], mirror_map, gamma)
         gfx, _ = func1.oracle(xx[i + 1])
         ghx[i + 1], hx[i + 1] = h.oracle(xx[i + 1])
         Dh = hx[i + 1] - hx[i] - ghx[i] * (xx[i + 1] - xx[i])
@@ -6,7 +6,7 @@ from PEPit.functions import ConvexIndicatorFunction
 from PEPit.primitive_steps import bregman_gradient_step
 
 
-def wc_no_lips_2(L, gamma, n, verbose=1):
+def wc_no_lips_2(L, gamma, n, verbose=1, solver=None):
     """
     Consider the constrainted composite convex minimization problem
 
@@ -60,6 +60,9 @@ def wc_no_lips_2(L, gamma, n, verbose=1):
                         - 0: This example's output.
                         - 1: This example's output + PEPit information.
                         - 2: This example's output + PEPit information + CVXPY details.
+        solver (str, optional): the CVXPY solver used to solve the PEP.
+                                Set to "auto" to let PEPit choose it depending on the size of the PEP,
+                                or to None (default) to let CVXPY choose it.
 
     Returns:
         pepit_tau (float): worst-case value.
@@ -78,8 +81,8 @@ def wc_no_lips_2(L, gamma, n, verbose=1):
                          function 1 : 12 scalar constraint(s) added
                          function 2 : Adding 12 scalar constraint(s) ...
                          function 2 : 12 scalar constraint(s) added
-                         function 3 : Adding 25 scalar constraint(s) ...
-                         function 3 : 25 scalar constraint(s) added
+                         function 3 : Adding 23 scalar constraint(s) ...
+                         function 3 : 23 scalar constraint(s) added
         (PEPit) Compiling SDP
         (PEPit) Calling SDP solver
         (PEPit) Solver status: optimal (solver: SCS); optimal value: 0.33333185324089176
@@ -96,7 +99,7 @@ def wc_no_lips_2(L, gamma, n, verbose=1):
     d1 = problem.declare_function(ConvexFunction, reuse_gradient=True)
     d2 = problem.declare_function(ConvexFunction, reuse_gradient=True)
     func1 = (d2 - d1) / 2
-    h = (d1 + d2) / L / 2
+    h = (d1 + d2) / (2 * L)
     func2 = problem.declare_function(ConvexIndicatorFunction, D=np.inf)
 
     # Define the function to optimize as the sum of func1 and func2
@@ -108,13 +111,16 @@ def wc_no_lips_2(L, gamma, n, verbose=1):
     gf0, f0 = func1.oracle(x0)
     _, F0 = func.oracle(x0)
 
+    # Define the mirror map of the Bregman gradient steps once for all the iterations
+    mirror_map = func2 + h
+
     # Compute n steps of the NoLips starting from x0
     x1, x2 = x0, x0
     gfx = gf0
     ghx = gh0
     hx1, hx2 = h0, h0
     for i in range(n):
-        x2, _, _ = bregman_gradient_step(gfx, ghx, func2 + h, gamma)
+        x2, _, _ = bregman_gradient_step(gfx, ghx, mirror_map, gamma)
         gfx, _ = func1.oracle(x2)
         ghx, hx2 = h.oracle(x2)
         Dhx = hx1 - hx2 - ghx * (x1 - x2)
@@ -128,7 +134,7 @@ def wc_no_lips_2(L, gamma, n, verbose=1):
 
     # Solve the PEP
     pepit_verbose = max(verbose, 0)
-    pepit_tau = problem.solve(verbose=pepit_verbose)
+    pepit_tau = problem.solve(verbose=pepit_verbose, solver=solver)
 
     # Compute theoretical guarantee (for comparison)
     theoretical_tau = gamma / n
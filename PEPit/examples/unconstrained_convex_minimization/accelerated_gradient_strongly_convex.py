@@ -97,14 +97,17 @@ def wc_accelerated_gradient_strongly_convex(mu, L, n, verbose=1):
     # Set the initial constraint that is a well-chosen distance between x0 and x^*
     problem.set_initial_condition(func(x0) - fs + mu / 2 * (x0 - xs) ** 2 <= 1)
 
+    # Compute the square root of the inverse condition number and the momentum coefficient once
+    sqrt_kappa = sqrt(mu / L)
+    momentum = (1 - sqrt_kappa) / (1 + sqrt_kappa)
+
     # Run n steps of the fast gradient method
-    kappa = mu / L
     x_new = x0
     y = x0
     for i in range(n):
         x_old = x_new
         x_new = y - 1 / L * func.gradient(y)
-        y = x_new + (1 - sqrt(kappa)) / (1 + sqrt(kappa)) * (x_new - x_old)
+        y = x_new + momentum * (x_new - x_old)
 
     # Set the performance metric to the function value accuracy
     problem.set_performance_metric(func(x_new) - fs)
@@ -114,7 +117,7 @@ def wc_accelerated_gradient_strongly_convex(mu, L, n, verbose=1):
     pepit_tau = problem.solve(verbose=pepit_verbose)
 
     # Compute theoretical guarantee (for comparison)
-    theoretical_tau = (1 - sqrt(kappa)) ** n
+    theoretical_tau = (1 - sqrt_kappa) ** n
     if mu == 0:
         print("Warning: momentum is tuned for strongly convex functions!")
 
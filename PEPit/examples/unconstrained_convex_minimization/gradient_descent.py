@@ -2,7 +2,7 @@ from PEPit import PEP
 from PEPit.functions import SmoothConvexFunction
 
 
-def wc_gradient_descent(L, gamma, n, verbose=1):
+def wc_gradient_descent(L, gamma, n, verbose=1, solver=None):
     """
     Consider the convex minimization problem
 
@@ -51,6 +51,9 @@ def wc_gradient_descent(L, gamma, n, verbose=1):
                         - 0: This example's output.
                         - 1: This example's output + PEPit information.
                         - 2: This example's output + PEPit information + CVXPY details.
+        solver (str, optional): the CVXPY solver used to solve the PEP.
+                                Set to "auto" to let PEPit choose it depending on the size of the PEP,
+                                or to None (default) to let CVXPY choose it.
 
     Returns:
         pepit_tau (float): worst-case value
@@ -101,7 +104,7 @@ def wc_gradient_descent(L, gamma, n, verbose=1):
 
     # Solve the PEP
     pepit_verbose = max(verbose, 0)
-    pepit_tau = problem.solve(verbose=pepit_verbose)
+    pepit_tau = problem.solve(verbose=pepit_verbose, solver=solver)
 
     # Compute theoretical guarantee (for comparison)
     theoretical_tau = L / (2 * (2 * n * L * gamma + 1))
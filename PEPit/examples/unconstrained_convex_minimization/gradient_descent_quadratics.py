@@ -1,8 +1,7 @@
 from PEPit import PEP
 from PEPit.functions import SmoothStronglyConvexQuadraticFunction
-import numpy as np
 
-def wc_gradient_descent_quadratics(mu, L, gamma, n, verbose=1):
+def wc_gradient_descent_quadratics(mu, L, gamma, n, verbose=1, solver=None):
     """
     Consider the convex minimization problem
 
@@ -54,6 +53,9 @@ def wc_gradient_descent_quadratics(mu, L, gamma, n, verbose=1):
                         - 0: This example's output.
                         - 1: This example's output + PEPit information.
                         - 2: This example's output + PEPit information + CVXPY details.
+        solver (str, optional): the CVXPY solver used to solve the PEP.
+                                Set to "auto" to let PEPit choose it depending on the size of the PEP,
+                                or to None (default) to let CVXPY choose it.
 
     Returns:
         pepit_tau (float): worst-case value
@@ -68,17 +70,20 @@ def wc_gradient_descent_quadratics(mu, L, gamma, n, verbose=1):
         (PEPit) Setting up the problem: Adding initial conditions and general constraints ...
         (PEPit) Setting up the problem: initial conditions and general constraints (1 constraint(s) added)
         (PEPit) Setting up the problem: interpolation conditions for 1 function(s)
-                         function 1 : Adding 36 scalar constraint(s) ...
-                         function 1 : 36 scalar constraint(s) added
+                         function 1 : Adding 21 scalar constraint(s) ...
+                         function 1 : 21 scalar constraint(s) added
                          function 1 : Adding 1 lmi constraint(s) ...
                          Size of PSD matrix 1: 6x6
                 		   function 1 : 1 lmi constraint(s) added
         (PEPit) Setting up the problem: constraints for 0 function(s)
         (PEPit) Compiling SDP
         (PEPit) Calling SDP solver
-        (PEPit) Solver status: optimal (solver: MOSEK); optimal value: 0.06495738898558603
+        (PEPit) Solver status: optimal (solver: SCS); optimal value: 0.06495677293541886
+        (PEPit) Postprocessing: solver's output is not entirely feasible (smallest eigenvalue of the Gram matrix is: -1.94e-05 < 0).
+         Small deviation from 0 may simply be due to numerical error. Big ones should be deeply investigated.
+         In any case, from now the provided values of parameters are based on the projection of the Gram matrix onto the cone of symmetric semi-definite matrix.
         *** Example file: worst-case performance of gradient descent on quadratics with fixed step-sizes ***
-        	PEPit guarantee:	    f(x_n)-f_* <= 0.0649574 ||x_0 - x_*||^2
+        	PEPit guarantee:	    f(x_n)-f_* <= 0.0649568 ||x_0 - x_*||^2
         	Theoretical guarantee:	 f(x_n)-f_* <= 0.0649574 ||x_0 - x_*||^2
 
     """
@@ -109,18 +114,12 @@ def wc_gradient_descent_quadratics(mu, L, gamma, n, verbose=1):
 
     # Solve the PEP
     pepit_verbose = max(verbose, 0)
-    pepit_tau = problem.solve(verbose=pepit_verbose)
+    pepit_tau = problem.solve(verbose=pepit_verbose, solver=solver)
     
     # Compute theoretical guarantee (for comparison)
-    t = 1 / (L*gamma*(2*n+1))
-    if t < mu/L:
-        alpha = mu/L
-    elif t > 1:
-        alpha = 1
-    else:
-        alpha = t
-        
-    theoretical_tau = 0.5*L*np.max((alpha*(1-alpha*L*gamma)**(2*n),(1-L*gamma)**(2*n)))
+    Lgamma = L*gamma
+    alpha = min(1, max(mu/L, 1 / (Lgamma*(2*n+1))))
+    theoretical_tau = 0.5*L*max(alpha*(1-alpha*Lgamma)**(2*n), (1-Lgamma)**(2*n))
 
     # Print conclusion if required
     if verbose != -1:
@@ -3,7 +3,7 @@ import numpy as np
 
 from PEPit.constraint import Constraint
 
-from PEPit.tools.dict_operations import merge_dict
+from PEPit.tools.dict_operations import merge_dict, subtract_dict
 
 
 class Expression(object):
@@ -23,6 +23,10 @@ class Expression(object):
                                    Keys are :class:`Expression` objects or tuple of 2 :class:`Point` objects.
                                    And values are their associated coefficients.
         counter (int): counts the number of **leaf** :class:`Expression` objects.
+        _sparse_weights (tuple): weights of self on the leaf function values and on the inner products of leaf
+                                 :class:`Point` objects, computed when self is first sent to the SDP solver
+                                 and reused afterwards.
+                                 Set to None before the first call to the method `PEP.solve` from the :class:`PEP`.
 
     :class:`Expression` objects can be added or subtracted together.
     They can also be added, subtracted, multiplied and divided by a scalar value.
@@ -82,6 +86,9 @@ class Expression(object):
         # Initialize the value attribute to None until the PEP is solved
         self._value = None
 
+        # Initialize the sparse weights to None until the expression is sent to the SDP solver
+        self._sparse_weights = None
+
         # If leaf function value, the decomposition is updated,
         # the object counter is set
         # and the class counter updated.
@@ -171,7 +178,13 @@ class Expression(object):
             TypeError: if provided `other` is neither an :class:`Expression` nor a scalar value.
 
         """
-        # A - B = A + (-B)
+        # If other is an Expression, subtract the decomposition_dicts
+        # without building the intermediate Expression -other
+        if isinstance(other, Expression):
+            subtracted_decomposition_dict = subtract_dict(self.decomposition_dict, other.decomposition_dict)
+            return Expression(is_leaf=False, decomposition_dict=subtracted_decomposition_dict)
+
+        # Otherwise A - B = A + (-B)
         return self.__add__(-other)
 
     def __rsub__(self, other):
@@ -315,7 +328,9 @@ class Expression(object):
             other :math:`\\leq` self (Expression): :class:`Constraint` object encoding the corresponding inequality.
 
         """
-        return -self <= -other
+
+        # other - self <= 0, built without the intermediate Expressions -self and -other
+        return Constraint(other - self, equality_or_inequality='inequality')
 
     def __gt__(self, other):
         """
@@ -3,7 +3,7 @@ from PEPit.expression import Expression
 from PEPit.constraint import Constraint
 from PEPit.psd_matrix import PSDMatrix
 
-from PEPit.tools.dict_operations import merge_dict, prune_dict
+from PEPit.tools.dict_operations import merge_dict, subtract_dict, prune_dict
 
 
 class Function(object):
@@ -28,12 +28,18 @@ class Function(object):
                                If False, a new subgradient is computed each time one is required.
         list_of_points (list): A list of triplets storing the points where this :class:`Function` has been evaluated,
                                as well as the associated subgradients and function values.
+        _evaluations_index (dict): An index of `list_of_points` allowing to quickly find
+                                   the subgradient and function value associated with a :class:`Point`.
+                                   Keys are the lengths of the decompositions of the points,
+                                   and values are the lists of triplets whose point has such a decomposition.
         list_of_stationary_points (list): The sublist of `self.list_of_points` of
                                           stationary points (characterized by some subgradient=0).
         list_of_constraints (list): The list of :class:`Constraint` objects associated with this :class:`Function`.
         list_of_psd (list): The list of :class:`PSDMatrix` objects associated with this :class:`Function`.
         list_of_class_constraints (list): The list of class interpolation :class:`Constraint` objects.
         list_of_class_psd (list): The list of :class:`PSDMatrix` objects associated associated with class interpolation constraints.
+        _key_of_class_constraints (tuple): The output of `_class_constraints_key` when `list_of_class_constraints`
+                                           was computed. Set to None until the class constraints are first generated.
         counter (int): counts the number of **leaf** :class:`Function` objects.
 
     Note:
@@ -113,10 +119,12 @@ class Function(object):
         # An optimal point will be stored in the 2 lists "list_of_stationary_points" and "list_of_points".
         self.list_of_stationary_points = list()
         self.list_of_points = list()
+        self._evaluations_index = dict()
         self.list_of_constraints = list()
         self.list_of_psd = list()
         self.list_of_class_constraints = list()
         self.list_of_class_psd = list()
+        self._key_of_class_constraints = None
 
     def get_is_leaf(self):
         """
@@ -168,8 +176,16 @@ class Function(object):
 
         """
 
-        # A-B = A+(-B)
-        return self.__add__(-other)
+        # Verify other is a function
+        assert isinstance(other, Function)
+
+        # Subtract decomposition dicts of self and other, without building the intermediate function -other
+        subtracted_decomposition_dict = subtract_dict(self.decomposition_dict, other.decomposition_dict)
+
+        # Create and return the newly created function
+        return Function(is_leaf=False,
+                        decomposition_dict=subtracted_decomposition_dict,
+                        reuse_gradient=self.reuse_gradient and other.reuse_gradient)
 
     def __neg__(self):
         """
@@ -296,6 +312,20 @@ class Function(object):
 
         raise NotImplementedError("This method must be overwritten in children classes")
 
+    def _class_constraints_key(self):
+        """
+        Summarize what the class constraints of this :class:`Function` depend on,
+        so that they are only generated again by the :class:`PEP` when it changed.
+
+        Children classes whose class constraints depend on other lists of points must overwrite this method.
+
+        Returns:
+            tuple: the number of points this :class:`Function` has been evaluated on.
+
+        """
+
+        return (len(self.list_of_points),)
+
     def _is_already_evaluated_on_point(self, point):
         """
         Check whether this :class:`Function` is already evaluated on the :class:`Point` "point" or not.
@@ -310,8 +340,9 @@ class Function(object):
 
         """
 
-        # Browse the list of point "self" has been evaluated on
-        for triplet in self.list_of_points:
+        # Browse the points "self" has been evaluated on whose decomposition has the same length as the one of "point".
+        # Those are typically very few, since the iterates of most methods involve more and more leaf points.
+        for triplet in self._evaluations_index.get(len(point.decomposition_dict), list()):
             if triplet[0].decomposition_dict == point.decomposition_dict:
                 # If "self" has been evaluated on "point", then break the loop and return its corresponding data
                 return triplet[1:]
@@ -382,11 +413,14 @@ class Function(object):
         assert isinstance(f, Expression)
 
         # Prune the decomposition dict of each element to verify if the point is optimal or not by testing gradient=0.
+        # Leaf elements are decomposed on themselves only, hence do not need to be pruned.
         for element in triplet:
-            element.decomposition_dict = prune_dict(element.decomposition_dict)
+            if not element.get_is_leaf():
+                element.decomposition_dict = prune_dict(element.decomposition_dict)
 
-        # Store the point in list_of_points
+        # Store the point in list_of_points, and index it by the length of its decomposition
         self.list_of_points.append(triplet)
+        self._evaluations_index.setdefault(len(point.decomposition_dict), list()).append(triplet)
 
         # If gradient==0, then store the point in list_of_optimal_points too
         if g.decomposition_dict == dict():
@@ -58,18 +58,27 @@ class ConvexIndicatorFunction(Function):
         see [1, Theorem 3.6].
         """
 
-        for i, point_i in enumerate(self.list_of_points):
+        # The diameter constraint does not depend on the pair of points, except through xi - xj
+        is_bounded = self.D != np.inf
+        D_squared = self.D ** 2
 
-            xi, gi, fi = point_i
+        for i, (xi, gi, fi) in enumerate(self.list_of_points):
 
-            for j, point_j in enumerate(self.list_of_points):
+            # Function values of an indicator function are null on the set
+            self.list_of_class_constraints.append(fi == 0)
 
-                xj, gj, fj = point_j
+            # The subgradient constraint is trivially satisfied when gi is null, e.g. when xi is a stationary point
+            gi_is_null = gi.decomposition_dict == dict()
 
-                if point_i == point_j:
-                    self.list_of_class_constraints.append(fi == 0)
+            for j, (xj, gj, fj) in enumerate(self.list_of_points):
 
-                else:
-                    self.list_of_class_constraints.append(gi * (xj - xi) <= 0)
-                    if self.D != np.inf:
-                        self.list_of_class_constraints.append((xi - xj) ** 2 <= self.D ** 2)
+                # Constraints involving two points with the same decomposition are trivially satisfied,
+                # hence they are not sent to the solver
+                if i != j and xi.decomposition_dict != xj.decomposition_dict:
+
+                    if not gi_is_null:
+                        self.list_of_class_constraints.append(gi * (xj - xi) <= 0)
+
+                    # The diameter constraint is symmetric in i and j, hence it is only added once per pair
+                    if is_bounded and i < j:
+                        self.list_of_class_constraints.append((xi - xj) ** 2 <= D_squared)
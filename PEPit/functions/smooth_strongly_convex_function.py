@@ -70,6 +70,16 @@ class SmoothStronglyConvexFunction(Function):
         Formulates the list of interpolation constraints for self (smooth strongly convex function); see [1, Theorem 4].
         """
 
+        # Interpolation conditions involve pairs of distinct points only.
+        # Return early otherwise, as the coefficients below are not defined when mu == L.
+        if len(self.list_of_points) <= 1:
+            return
+
+        # Those coefficients of the interpolation conditions do not depend on the points
+        gradient_coefficient = 1 / (2 * self.L)
+        strong_convexity_coefficient = self.mu / (2 * (1 - self.mu / self.L))
+        inverse_L = 1 / self.L
+
         for point_i in self.list_of_points:
 
             xi, gi, fi = point_i
@@ -80,8 +90,13 @@ class SmoothStronglyConvexFunction(Function):
 
                 if point_i != point_j:
 
+                    # Differences used several times in the interpolation condition
+                    xij = xi - xj
+                    gij = gi - gj
+                    dij = xij - inverse_L * gij
+
                     # Interpolation conditions of smooth strongly convex functions class
                     self.list_of_class_constraints.append(fi - fj >=
-                                        gj * (xi - xj)
-                                        + 1/(2*self.L) * (gi - gj) ** 2
-                                        + self.mu / (2 * (1 - self.mu / self.L)) * (xi - xj - 1/self.L * (gi - gj))**2)
+                                                          gj * xij
+                                                          + gradient_coefficient * gij ** 2
+                                                          + strong_convexity_coefficient * dij ** 2)
@@ -72,26 +72,25 @@ class SmoothStronglyConvexQuadraticFunction(Function):
         N = len(self.list_of_points)
         T = np.empty([N, N], dtype = Expression)
 
-        i = 0
-        for point_i in self.list_of_points:
+        for i, point_i in enumerate(self.list_of_points):
 
             xi, gi, fi = point_i
 
-            j = 0
-            for point_j in self.list_of_points:
+            for j, point_j in enumerate(self.list_of_points):
 
                 xj, gj, fj = point_j
 
-                if point_i != point_j:
-                    
+                # The symmetry condition of the pair (i, j) is the same as the one of the pair (j, i),
+                # hence it is only added once.
+                if i < j:
+
                     self.list_of_class_constraints.append(xi*gj == xj*gi)
-                    
-                else:
+
+                elif i == j:
+
                     self.list_of_class_constraints.append(fi == 0.5*xi*gi)
 
                 T[i,j] = self.L*gi*xj - gi*gj - self.mu*self.L*xi*xj + self.mu*xi*gj
-                j = j + 1
-            i = i + 1
-    
+
         psd_matrix = PSDMatrix(matrix_of_expressions=T)
         self.list_of_class_psd.append(psd_matrix)
\ No newline at end of file
@@ -128,6 +128,18 @@ class LinearOperator(Function):
         self.list_of_class_psd.append(psd_matrix2)
         
         
+    def _class_constraints_key(self):
+        """
+        Summarize what the class constraints of self depend on,
+        i.e. the points self and its transpose have been evaluated on.
+
+        Returns:
+            tuple: the numbers of points in `list_of_points` and in `second_list_of_points`.
+
+        """
+
+        return len(self.list_of_points), len(self.second_list_of_points)
+
     def gradient_transpose(self, point):
         """
         Return the transpose of the operator evaluated at `point`, i.e. M^T(point)
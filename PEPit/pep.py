@@ -1,4 +1,6 @@
+import warnings
 import numpy as np
+import scipy.sparse as sp
 import cvxpy as cp
 
 from PEPit.point import Point
@@ -26,12 +28,20 @@ class PEP(object):
                                             The pep maximizes the minimum of all performance metrics.
         list_of_psd (list): list of :class:`PSDMatrix` objects.
                             The PEP consider the associated LMI constraints psd_matrix >> 0.
-        _list_of_constraints_sent_to_cvxpy (list): a list of all the :class:`Constraint` objects that are sent to CVXPY
+        _list_of_constraints_sent_to_cvxpy (list): a list of all the :class:`Constraint` objects,
+                                                   lists of :class:`Constraint` objects
+                                                   and :class:`PSDMatrix` objects that are sent to CVXPY
                                                    for solving the SDP. It should not be updated manually.
                                                    Only the `solve` method takes care of it.
         _list_of_cvxpy_constraints (list): a list of all the CVXPY Constraints objects that have been sent by PEPit
                                            for solving the SDP. It should not be updated manually.
                                            Only the `solve` method takes care of it.
+        _cvxpy_problem_cache (tuple): the key of the content of the PEP (see `_get_structure_key`),
+                                      the cvxpy problem, its variables objective, F and G, the
+                                      corresponding `_list_of_constraints_sent_to_cvxpy`
+                                      and `list_of_performance_metrics`,
+                                      as built by the last call to the `solve` method.
+                                      Set to None before the first call to `solve`.
         counter (int): counts the number of :class:`PEP` objects.
                        Ideally, only one is defined at a time.
 
@@ -40,6 +50,24 @@ class PEP(object):
     # It counts the number of PEP defined instantiated.
     counter = 0
 
+    # Tolerances of the supported solvers for each non default accuracy of the method `solve`.
+    _accuracy_options = {
+        "screening": {
+            "SCS": {"eps_abs": 1e-4, "eps_rel": 1e-4, "max_iters": 2500},
+            "CLARABEL": {"tol_gap_abs": 1e-4, "tol_gap_rel": 1e-4, "tol_feas": 1e-4},
+            "MOSEK": {"mosek_params": {"MSK_DPAR_INTPNT_CO_TOL_PFEAS": 1e-5,
+                                       "MSK_DPAR_INTPNT_CO_TOL_DFEAS": 1e-5,
+                                       "MSK_DPAR_INTPNT_CO_TOL_REL_GAP": 1e-5}},
+        },
+        "tight": {
+            "SCS": {"eps_abs": 1e-8, "eps_rel": 1e-8, "max_iters": 1000000},
+            "CLARABEL": {"tol_gap_abs": 1e-9, "tol_gap_rel": 1e-9, "tol_feas": 1e-9},
+            "MOSEK": {"mosek_params": {"MSK_DPAR_INTPNT_CO_TOL_PFEAS": 1e-10,
+                                       "MSK_DPAR_INTPNT_CO_TOL_DFEAS": 1e-10,
+                                       "MSK_DPAR_INTPNT_CO_TOL_REL_GAP": 1e-10}},
+        },
+    }
+
     def __init__(self):
         """
         A :class:`PEP` object can be instantiated without any argument
@@ -47,6 +75,25 @@ class PEP(object):
         Example:
             >>> pep = PEP()
 
+        """
+        # Initialize an empty PEP
+        self.reset()
+
+    def reset(self):
+        """
+        Remove all the functions, points, constraints, performance metrics and PSD matrices of this :class:`PEP`,
+        so that it can be used to describe a new problem from scratch, exactly as a newly instantiated :class:`PEP`.
+
+        Note:
+            As when instantiating a new :class:`PEP`, all the :class:`Point`, :class:`Expression`
+            and :class:`Function` objects created before the reset must not be used afterwards.
+
+        Example:
+            >>> pep = PEP()
+            >>> func = pep.declare_function(SmoothConvexFunction, L=1)
+            >>> pep.reset()
+            >>> func = pep.declare_function(SmoothConvexFunction, L=2)
+
         """
         # Set all counters to 0 to recreate
         # points, expressions, functions and block partitions from scratch at the beginning of each PEP.
@@ -72,6 +119,9 @@ class PEP(object):
         self._list_of_constraints_sent_to_cvxpy = list()
         self._list_of_cvxpy_constraints = list()
 
+        # Initialize the cvxpy problem built by the solve method, kept to be solved again if the PEP does not change
+        self._cvxpy_problem_cache = None
+
     @staticmethod
     def _reset_classes():
         """
@@ -217,87 +267,167 @@ class PEP(object):
         self.list_of_performance_metrics.append(expression)
 
     @staticmethod
-    def _expression_to_cvxpy(expression, F, G):
+    def _expression_to_sparse_weights(expression):
         """
-        Create a cvxpy compatible expression from an :class:`Expression`.
+        Translate an :class:`Expression` into the lists of its nonzero weights
+        on the function values and on the Gram matrix.
+
+        The result is stored in the attribute `_sparse_weights` of `expression`,
+        so that an expression sent several times to the SDP solver, such as a class constraint
+        of a function when the :class:`PEP` is solved again, is only translated once.
 
         Args:
             expression (Expression): any expression.
-            F (cvxpy Variable): a vector representing the function values.
-            G (cvxpy Variable): a matrix representing the Gram matrix of all leaf :class:`Point` objects.
 
         Returns:
-            cvxpy_variable (cvxpy Variable): The expression in terms of F and G.
+            F_cols (list): the indices of the leaf function values in `expression`.
+            F_vals (list): the weights of the leaf function values in `expression`.
+            G_cols1 (list): the indices of the first leaf :class:`Point` objects of the inner products in `expression`.
+            G_cols2 (list): the indices of the second leaf :class:`Point` objects of the inner products in `expression`.
+            G_vals (list): the weights of the inner products in `expression`.
+            cons (float): the constant part of `expression`.
 
         """
-        cvxpy_variable = 0
-        Fweights = np.zeros((Expression.counter,))
-        Gweights = np.zeros((Point.counter, Point.counter))
+        # Return the stored weights if expression has already been translated
+        if expression._sparse_weights is not None:
+            return expression._sparse_weights
+
+        cons = 0
+        F_cols, F_vals = list(), list()
+        G_cols1, G_cols2, G_vals = list(), list(), list()
 
         # If simple function value, then simply return the right coordinate in F
         if expression.get_is_leaf():
-            Fweights[expression.counter] += 1
-        # If composite, combine all the cvxpy expression found from leaf expressions
+            F_cols.append(expression.counter)
+            F_vals.append(1)
+        # If composite, collect all the weights found from leaf expressions
         else:
             for key, weight in expression.decomposition_dict.items():
-                # Function values are stored in F
-                if type(key) == Expression:
-                    assert key.get_is_leaf()
-                    Fweights[key.counter] += weight
-                # Inner products are stored in G
-                elif type(key) == tuple:
+                # Inner products are stored in G.
+                # They are by far the most common keys, hence they are checked first.
+                if type(key) is tuple:
                     point1, point2 = key
-                    assert point1.get_is_leaf()
-                    assert point2.get_is_leaf()
-                    Gweights[point1.counter, point2.counter] += weight
+                    assert point1._is_leaf and point2._is_leaf
+                    G_cols1.append(point1.counter)
+                    G_cols2.append(point2.counter)
+                    G_vals.append(weight)
+                # Function values are stored in F
+                elif type(key) is Expression:
+                    assert key._is_leaf
+                    F_cols.append(key.counter)
+                    F_vals.append(weight)
                 # Constants are simply constants
                 elif key == 1:
-                    cvxpy_variable += weight
+                    cons += weight
                 # Others don't exist and raise an Exception
                 else:
                     raise TypeError("Expressions are made of function values, inner products and constants only!")
 
-        cvxpy_variable += F @ Fweights + cp.sum(cp.multiply(G, Gweights))
+        # Store and return the weights of the input expression
+        expression._sparse_weights = (F_cols, F_vals, G_cols1, G_cols2, G_vals, cons)
+        return expression._sparse_weights
+
+    @staticmethod
+    def _list_of_expressions_to_cvxpy(list_of_expressions, F, G):
+        """
+        Create a single cvxpy vector expression from a list of :class:`Expression` objects.
+
+        Args:
+            list_of_expressions (list): a non empty list of :class:`Expression` objects.
+            F (cvxpy Variable): a vector representing the function values.
+            G (cvxpy Variable): a matrix representing the Gram matrix of all leaf :class:`Point` objects.
 
-        # Return the input expression in a cvxpy variable
+        Returns:
+            cvxpy_variable (cvxpy Variable): The vector whose entries are the input expressions in terms of F and G.
+
+        """
+        nb_expressions = len(list_of_expressions)
+        nb_points = Point.counter
+        cons = np.zeros((nb_expressions,))
+
+        # Collect the nonzero weights as parallel lists of columns and values, as well as the number of weights
+        # of each expression (i.e. in each row).
+        # The column of the inner product of leaf points i and j is i + j * nb_points in the flattened Gram matrix.
+        F_counts, F_cols, F_vals = list(), list(), list()
+        G_counts, G_cols1, G_cols2, G_vals = list(), list(), list(), list()
+        for i, expression in enumerate(list_of_expressions):
+            F_cols_i, F_vals_i, G_cols1_i, G_cols2_i, G_vals_i, cons[i] = PEP._expression_to_sparse_weights(expression)
+            F_counts.append(len(F_cols_i))
+            F_cols += F_cols_i
+            F_vals += F_vals_i
+            G_counts.append(len(G_vals_i))
+            G_cols1 += G_cols1_i
+            G_cols2 += G_cols2_i
+            G_vals += G_vals_i
+
+        # Build the index arrays with numpy, using 32 bits integers whenever the Gram matrix is small enough
+        index_type = np.int32 if nb_points ** 2 <= np.iinfo(np.int32).max else np.int64
+        rows = np.arange(nb_expressions, dtype=index_type)
+        F_rows = np.repeat(rows, F_counts)
+        F_cols = np.asarray(F_cols, dtype=index_type)
+        G_rows = np.repeat(rows, G_counts)
+        G_cols = np.asarray(G_cols1, dtype=index_type) + np.asarray(G_cols2, dtype=index_type) * nb_points
+
+        # Accumulate the collected weights into sparse matrices, one row per expression.
+        # Each expression only involves a few function values and inner products,
+        # hence most of the weights are zero.
+        Fweights = sp.coo_matrix((F_vals, (F_rows, F_cols)), shape=(nb_expressions, Expression.counter)).tocsr()
+        Gweights = sp.coo_matrix((G_vals, (G_rows, G_cols)), shape=(nb_expressions, nb_points ** 2)).tocsr()
+
+        cvxpy_variable = cons + cp.Constant(Fweights) @ F \
+                         + cp.Constant(Gweights) @ cp.reshape(G, (nb_points ** 2,), order='F')
+
+        # Return the input expressions in a single cvxpy variable
         return cvxpy_variable
 
-    def send_constraint_to_cvxpy(self, constraint, F, G):
+    def send_constraints_to_cvxpy(self, list_of_constraints, F, G):
         """
-        Transform a PEPit :class:`Constraint` into a CVXPY one
+        Transform a list of PEPit :class:`Constraint` objects into at most 2 vectorized CVXPY constraints,
+        one gathering all the inequalities and one gathering all the equalities,
         and add the 2 formats of the constraints into the tracking lists.
 
         Args:
-            constraint (Constraint): a :class:`Constraint` object to be sent to CVXPY.
+            list_of_constraints (list): a list of :class:`Constraint` objects to be sent to CVXPY.
             F (CVXPY Variable): a CVXPY Variable referring to function values.
             G (CVXPY Variable): a CVXPY Variable referring to points and gradients.
 
         Raises:
-            ValueError if the attribute `equality_or_inequality` of the :class:`Constraint`
+            ValueError if the attribute `equality_or_inequality` of a :class:`Constraint`
             is neither `equality`, nor `inequality`.
 
         """
 
-        # Sanity check
-        assert isinstance(constraint, Constraint)
+        # Separate equalities and inequalities
+        list_of_inequalities = list()
+        list_of_equalities = list()
+        for constraint in list_of_constraints:
 
-        # Add constraint to the attribute _list_of_constraints_sent_to_cvxpy to keep track of
-        # all the constraints that have been sent to CVXPY as well as the order.
-        self._list_of_constraints_sent_to_cvxpy.append(constraint)
+            # Sanity check
+            assert isinstance(constraint, Constraint)
 
-        # Distinguish equality and inequality
-        if constraint.equality_or_inequality == 'inequality':
-            cvxpy_constraint = self._expression_to_cvxpy(constraint.expression, F, G) <= 0
-        elif constraint.equality_or_inequality == 'equality':
-            cvxpy_constraint = self._expression_to_cvxpy(constraint.expression, F, G) == 0
-        else:
-            # Raise an exception otherwise
-            raise ValueError('The attribute \'equality_or_inequality\' of a constraint object'
-                             ' must either be \'equality\' or \'inequality\'.'
-                             'Got {}'.format(constraint.equality_or_inequality))
+            if constraint.equality_or_inequality == 'inequality':
+                list_of_inequalities.append(constraint)
+            elif constraint.equality_or_inequality == 'equality':
+                list_of_equalities.append(constraint)
+            else:
+                # Raise an exception otherwise
+                raise ValueError('The attribute \'equality_or_inequality\' of a constraint object'
+                                 ' must either be \'equality\' or \'inequality\'.'
+                                 'Got {}'.format(constraint.equality_or_inequality))
 
-        # Add the corresponding CVXPY constraint to the list of constraints to be sent to CVXPY
-        self._list_of_cvxpy_constraints.append(cvxpy_constraint)
+        # Send each group as a single CVXPY constraint.
+        # The whole group is added to the attribute _list_of_constraints_sent_to_cvxpy to keep track of
+        # all the constraints that have been sent to CVXPY as well as the order.
+        if len(list_of_inequalities) > 0:
+            expressions = self._list_of_expressions_to_cvxpy([constraint.expression
+                                                              for constraint in list_of_inequalities], F, G)
+            self._list_of_constraints_sent_to_cvxpy.append(list_of_inequalities)
+            self._list_of_cvxpy_constraints.append(expressions <= 0)
+        if len(list_of_equalities) > 0:
+            expressions = self._list_of_expressions_to_cvxpy([constraint.expression
+                                                              for constraint in list_of_equalities], F, G)
+            self._list_of_constraints_sent_to_cvxpy.append(list_of_equalities)
+            self._list_of_cvxpy_constraints.append(expressions == 0)
 
     def send_lmi_constraint_to_cvxpy(self, psd_counter, psd_matrix, F, G, verbose):
         """
@@ -330,10 +460,15 @@ class PEP(object):
         # Store the lmi constraint
         cvxpy_constraints_list = [M >> 0]
 
+        # Translate all the entries of the matrix at once (row by row)
+        entries = self._list_of_expressions_to_cvxpy([psd_matrix[i, j]
+                                                      for i in range(psd_matrix.shape[0])
+                                                      for j in range(psd_matrix.shape[1])], F, G)
+
         # Store one correspondence constraint per entry of the matrix
         for i in range(psd_matrix.shape[0]):
             for j in range(psd_matrix.shape[1]):
-                cvxpy_constraints_list.append(M[i, j] == self._expression_to_cvxpy(psd_matrix[i, j], F, G))
+                cvxpy_constraints_list.append(M[i, j] == entries[i * psd_matrix.shape[1] + j])
 
         # Print a message if verbose mode activated
         if verbose:
@@ -342,48 +477,20 @@ class PEP(object):
         # Add the corresponding CVXPY constraints to the list of constraints to be sent to CVXPY
         self._list_of_cvxpy_constraints += cvxpy_constraints_list
 
-    def solve(self, verbose=1, return_full_cvxpy_problem=False,
-              dimension_reduction_heuristic=None, eig_regularization=1e-3, tol_dimension_reduction=1e-5,
-              **kwargs):
+    def _build_cvxpy_problem(self, verbose=1):
         """
-        Transform the :class:`PEP` under the SDP form, and solve it.
+        Generate the class constraints of all the functions and translate the PEP into a cvxpy problem.
 
         Args:
-            verbose (int): Level of information details to print (Override the CVXPY solver verbose parameter).
-
-                            - 0: No verbose at all
-                            - 1: PEPit information is printed but not CVXPY's
-                            - 2: Both PEPit and CVXPY details are printed
-            return_full_cvxpy_problem (bool): If True, return the cvxpy Problem object.
-                                              If False, return the worst case value only.
-                                              Set to False by default.
-            dimension_reduction_heuristic (str, optional): An heuristic to reduce the dimension of the solution
-                                                           (rank of the Gram matrix). Set to None to deactivate
-                                                           it (default value). Available heuristics are:
-                                                           
-                                                            - "trace": minimize :math:`Tr(G)`
-                                                            - "logdet{an integer n}": minimize
-                                                              :math:`\\log\\left(\\mathrm{Det}(G)\\right)`
-                                                              using n iterations of local approximation problems.
-
-            eig_regularization (float, optional): The regularization we use to make
-                                                  :math:`G + \\mathrm{eig_regularization}I_d \succ 0`.
-                                                  (only used when "dimension_reduction_heuristic" is not None)
-                                                  The default value is 1e-5.
-            tol_dimension_reduction (float, optional): The error tolerance in the heuristic minimization problem.
-                                                       Precisely, the second problem minimizes "optimal_value - tol"
-                                                       (only used when "dimension_reduction_heuristic" is not None)
-                                                       The default value is 1e-5.
-            kwargs (keywords, optional): Additional CVXPY solver specific arguments.
+            verbose (int): Level of information details to print.
 
         Returns:
-            float or cp.Problem: Value of the performance metric of cp.Problem object corresponding to the SDP.
-                                 The value only is returned by default.
+            prob (cp.Problem): the cvxpy problem maximizing `objective`.
+            objective (cvxpy Variable): the minimum of the performance metrics.
+            F (cvxpy Variable): a vector representing the function values.
+            G (cvxpy Variable): a matrix representing the Gram matrix of all leaf :class:`Point` objects.
 
         """
-        # Set CVXPY verbose to True if verbose mode is at least 2
-        kwargs["verbose"] = verbose >= 2
-
         # Initialize lists of constraints that are used to solve the SDP.
         # Those lists should not be updated by hand, only the solve method does update them.
         # If solve is called again, they should be reinitialized.
@@ -396,13 +503,25 @@ class PEP(object):
         list_of_functions_with_constraints = [function for function in Function.list_of_functions
                                               if len(function.list_of_constraints) > 0 or len(function.list_of_psd) > 0]
 
-        # Create all class constraints
+        # Create all class constraints.
+        # Those only depend on the points each function has been evaluated on,
+        # hence they are generated again only if those changed since the last call to solve.
         for function in list_of_leaf_functions:
-            function.add_class_constraints()
-            
-        # Create all partition constraints
+            class_constraints_key = function._class_constraints_key()
+            if function._key_of_class_constraints != class_constraints_key:
+                function.list_of_class_constraints = list()
+                function.list_of_class_psd = list()
+                function.add_class_constraints()
+                function._key_of_class_constraints = class_constraints_key
+
+        # Create all partition constraints.
+        # Those only depend on the points decomposed in each partition,
+        # hence they are generated again only if new points were decomposed since the last call to solve.
         for partition in BlockPartition.list_of_partitions:
-            partition.add_partition_constraints()
+            if partition._nb_points_in_partition_constraints != len(partition.blocks_dict):
+                partition.list_of_constraints = list()
+                partition.add_partition_constraints()
+                partition._nb_points_in_partition_constraints = len(partition.blocks_dict)
 
         # Define the cvxpy variables
         objective = cp.Variable()
@@ -421,16 +540,20 @@ class PEP(object):
         # is equivalent to maximize objective which is constraint to be smaller than all the performance metrics.
         for performance_metric in self.list_of_performance_metrics:
             assert isinstance(performance_metric, Expression)
-            self._list_of_cvxpy_constraints.append(objective <= self._expression_to_cvxpy(performance_metric, F, G))
+        if len(self.list_of_performance_metrics) > 0:
+            self._list_of_cvxpy_constraints.append(
+                objective <= self._list_of_expressions_to_cvxpy(self.list_of_performance_metrics, F, G))
         if verbose:
             print('(PEPit) Setting up the problem:'
                   ' performance measure is minimum of {} element(s)'.format(len(self.list_of_performance_metrics)))
 
+        # Scalar constraints are gathered in a single list and sent to CVXPY all at once
+        list_of_scalar_constraints = list()
+
         # Defining initial conditions and general constraints
         if verbose:
             print('(PEPit) Setting up the problem: Adding initial conditions and general constraints ...')
-        for condition in self.list_of_constraints:
-            self.send_constraint_to_cvxpy(condition, F, G)
+        list_of_scalar_constraints += self.list_of_constraints
         if verbose:
             print('(PEPit) Setting up the problem:'
                   ' initial conditions and general constraints ({} constraint(s) added)'.format(len(self.list_of_constraints)))
@@ -453,8 +576,7 @@ class PEP(object):
             if verbose:
                 print('\t\t function', function_counter, ':', 'Adding', len(function.list_of_class_constraints), 'scalar constraint(s) ...')
 
-            for constraint in function.list_of_class_constraints:
-                self.send_constraint_to_cvxpy(constraint, F, G)
+            list_of_scalar_constraints += function.list_of_class_constraints
 
             if verbose:
                 print('\t\t function', function_counter, ':', len(function.list_of_class_constraints), 'scalar constraint(s) added')
@@ -482,8 +604,7 @@ class PEP(object):
                     print('\t\t function', function_counter, ':', 'Adding', len(function.list_of_constraints),
                           'scalar constraint(s) ...')
 
-                for constraint in function.list_of_constraints:
-                    self.send_constraint_to_cvxpy(constraint, F, G)
+                list_of_scalar_constraints += function.list_of_constraints
 
                 if verbose:
                     print('\t\t function', function_counter, ':', len(function.list_of_constraints),
@@ -511,21 +632,157 @@ class PEP(object):
             if verbose:
                 print('\t\t partition', partition_counter, 'with', partition.get_nb_blocks(),
                       'blocks: Adding', len(partition.list_of_constraints), 'scalar constraint(s)...')
-            for constraint in partition.list_of_constraints:
-                self.send_constraint_to_cvxpy(constraint, F, G)
+            list_of_scalar_constraints += partition.list_of_constraints
             if verbose:
                 print('\t\t partition', partition_counter, 'with', partition.get_nb_blocks(),
                       'blocks:', len(partition.list_of_constraints), 'scalar constraint(s) added')
 
+        # Send all the scalar constraints to CVXPY
+        self.send_constraints_to_cvxpy(list_of_scalar_constraints, F, G)
+
         # Create the cvxpy problem
         if verbose:
             print('(PEPit) Compiling SDP')
         prob = cp.Problem(objective=cp.Maximize(objective), constraints=self._list_of_cvxpy_constraints)
 
+        # Return the problem and its variables
+        return prob, objective, F, G
+
+    def _get_structure_key(self):
+        """
+        Summarize the content of this :class:`PEP` so as to detect whether it changed between two calls to `solve`.
+
+        Any new :class:`Point`, :class:`Expression`, :class:`Constraint`, :class:`PSDMatrix`, :class:`Function`
+        or :class:`BlockPartition`, any new point a function is evaluated on, as well as any performance metric,
+        constraint or PSD matrix added to, removed from or replaced in this :class:`PEP` or a function
+        changes the key.
+
+        Note:
+            The performance metrics, constraints and PSD matrices are identified by their `id`,
+            hence they must be kept alive as long as the key is used.
+
+        Returns:
+            tuple: the key.
+
+        """
+
+        return (Point.counter, Expression.counter, Constraint.counter, PSDMatrix.counter,
+                Function.counter, BlockPartition.counter,
+                tuple(map(id, self.list_of_performance_metrics)),
+                tuple(map(id, self.list_of_constraints)),
+                tuple(map(id, self.list_of_psd)),
+                tuple((function._class_constraints_key(),
+                       tuple(map(id, function.list_of_constraints)),
+                       tuple(map(id, function.list_of_psd)))
+                      for function in Function.list_of_functions))
+
+    def solve(self, verbose=1, return_full_cvxpy_problem=False,
+              dimension_reduction_heuristic=None, eig_regularization=1e-3, tol_dimension_reduction=1e-5,
+              accuracy="default", **kwargs):
+        """
+        Transform the :class:`PEP` under the SDP form, and solve it.
+
+        Args:
+            verbose (int): Level of information details to print (Override the CVXPY solver verbose parameter).
+
+                            - 0: No verbose at all
+                            - 1: PEPit information is printed but not CVXPY's
+                            - 2: Both PEPit and CVXPY details are printed
+            return_full_cvxpy_problem (bool): If True, return the cvxpy Problem object.
+                                              If False, return the worst case value only.
+                                              Set to False by default.
+            dimension_reduction_heuristic (str, optional): An heuristic to reduce the dimension of the solution
+                                                           (rank of the Gram matrix). Set to None to deactivate
+                                                           it (default value). Available heuristics are:
+                                                           
+                                                            - "trace": minimize :math:`Tr(G)`
+                                                            - "logdet{an integer n}": minimize
+                                                              :math:`\\log\\left(\\mathrm{Det}(G)\\right)`
+                                                              using n iterations of local approximation problems.
+
+                                                           The "logdet" iterations are skipped when the solution
+                                                           of the PEP has already rank at most 1.
+
+            eig_regularization (float, optional): The regularization we use to make
+                                                  :math:`G + \\mathrm{eig_regularization}I_d \succ 0`.
+                                                  (only used when "dimension_reduction_heuristic" is not None)
+                                                  The default value is 1e-5.
+            tol_dimension_reduction (float, optional): The error tolerance in the heuristic minimization problem.
+                                                       Precisely, the second problem minimizes "optimal_value - tol"
+                                                       (only used when "dimension_reduction_heuristic" is not None)
+                                                       The default value is 1e-5.
+            accuracy (str, optional): The accuracy required from the SDP solver. Available values are:
+
+                                       - "default": the default tolerances of the solver (default value).
+                                       - "screening": loose tolerances and a limited number of iterations.
+                                         This is much faster, but the returned value is only meant to compare
+                                         parameters (e.g. to draw a convergence plot or to tune a step size);
+                                         the final guarantee should be computed again with "default" or "tight".
+                                       - "tight": tight tolerances, for final results.
+
+                                      Only SCS, CLARABEL and MOSEK are supported, and the tolerances set by
+                                      `accuracy` are overwritten by the ones explicitly given in `kwargs`.
+            kwargs (keywords, optional): Additional CVXPY solver specific arguments.
+                                         In particular, `solver="auto"` lets PEPit choose the solver
+                                         depending on the installed solvers and on the size of the SDP
+                                         (MOSEK first, then CLARABEL for small SDPs, then the default of CVXPY).
+                                         If the chosen solver fails or returns an inaccurate solution,
+                                         the SDP is solved again with the default solver of CVXPY.
+                                         When the PEP did not change since the previous call to `solve`,
+                                         the same SDP is solved again and `warm_start` is set to True by default.
+
+        Returns:
+            float or cp.Problem: Value of the performance metric of cp.Problem object corresponding to the SDP.
+                                 The value only is returned by default.
+
+        """
+        # Set CVXPY verbose to True if verbose mode is at least 2
+        kwargs["verbose"] = verbose >= 2
+
+        # Build the SDP, unless this PEP did not change since the previous call to solve.
+        # In the latter case, the same cvxpy problem is solved again,
+        # which also allows CVXPY to reuse its own compilation of the problem
+        # and the solver to start from the previous solution.
+        structure_key = self._get_structure_key()
+        if self._cvxpy_problem_cache is not None and self._cvxpy_problem_cache[0] == structure_key:
+            if verbose:
+                print('(PEPit) Setting up the problem: the PEP did not change since the previous call to solve,'
+                      ' reusing the same SDP')
+            _, prob, objective, F, G, list_of_constraints_sent_to_cvxpy, _ = self._cvxpy_problem_cache
+            self._list_of_constraints_sent_to_cvxpy = list(list_of_constraints_sent_to_cvxpy)
+            self._list_of_cvxpy_constraints = list(prob.constraints)
+
+            # Start the solver from the solution of the previous call to solve, unless specified otherwise
+            kwargs.setdefault("warm_start", True)
+        else:
+            prob, objective, F, G = self._build_cvxpy_problem(verbose=verbose)
+
+            # Keep the performance metrics alive with the key,
+            # as the constraints and PSD matrices are through the list of constraints sent to cvxpy
+            self._cvxpy_problem_cache = (self._get_structure_key(), prob, objective, F, G,
+                                         list(self._list_of_constraints_sent_to_cvxpy),
+                                         list(self.list_of_performance_metrics))
+
+        # Choose the solver if required.
+        # If the solver chosen by PEPit fails, the problem is solved again with the default choice of CVXPY.
+        list_of_solver_kwargs = list()
+        if kwargs.get("solver") == "auto":
+            chosen_solver = self._choose_solver(Point.counter,
+                                                dimension_reduction=bool(dimension_reduction_heuristic))
+            kwargs["solver"] = None
+            if chosen_solver is not None:
+                list_of_solver_kwargs.append(dict(kwargs, solver=chosen_solver))
+        list_of_solver_kwargs.append(kwargs)
+
+        # Translate the required accuracy into tolerances of each solver
+        if accuracy != "default":
+            list_of_solver_kwargs = [self._add_accuracy_options(accuracy, solver_kwargs, verbose=verbose)
+                                     for solver_kwargs in list_of_solver_kwargs]
+
         # Solve it
         if verbose:
             print('(PEPit) Calling SDP solver')
-        prob.solve(**kwargs)
+        self._solve_cvxpy_problem(prob, list_of_solver_kwargs, verbose=verbose)
         if verbose:
             print('(PEPit) Solver status: {} (solver: {}); optimal value: {}'.format(prob.status,
                                                                                      prob.solver_stats.solver_name,
@@ -546,14 +803,24 @@ class PEP(object):
         assert self._list_of_cvxpy_constraints == prob.constraints
         dual_values = [constraint.dual_value for constraint in prob.constraints]
 
-        # Perform a dimension reduction if required
+        # Estimate the dimension of the solution before dimension reduction
         if dimension_reduction_heuristic:
-
-            # Print the estimated dimension before dimension reduction
             nb_eigenvalues, eig_threshold, corrected_G_value = self.get_nb_eigenvalues_and_corrected_matrix(G.value)
             if verbose:
                 print('(PEPit) Postprocessing: {} eigenvalue(s) > {} before dimension reduction'.format(nb_eigenvalues,
                                                                                                         eig_threshold))
+
+            # A solution of rank at most 1 cannot be further reduced,
+            # hence the iterations of the logdet heuristic are not run
+            if dimension_reduction_heuristic.startswith("logdet") and nb_eigenvalues <= 1:
+                dimension_reduction_heuristic = None
+                if verbose:
+                    print('(PEPit) Postprocessing: the solution has already rank {}, skipping dimension reduction'.format(
+                        nb_eigenvalues))
+
+        # Perform a dimension reduction if required
+        if dimension_reduction_heuristic:
+            if verbose:
                 print('(PEPit) Calling SDP solver')
 
             # Add the constraint that the objective stay close to its actual value
@@ -563,7 +830,7 @@ class PEP(object):
             if dimension_reduction_heuristic == "trace":
                 heuristic = cp.trace(G)
                 prob = cp.Problem(objective=cp.Minimize(heuristic), constraints=self._list_of_cvxpy_constraints)
-                prob.solve(**kwargs)
+                self._solve_cvxpy_problem(prob, list_of_solver_kwargs, verbose=verbose)
 
                 # Store the actualized obtained value
                 wc_value = objective.value
@@ -573,11 +840,18 @@ class PEP(object):
 
             elif dimension_reduction_heuristic.startswith("logdet"):
                 niter = int(dimension_reduction_heuristic[6:])
+
+                # Build the problem once with the weight matrix W as a parameter,
+                # so that each iteration only updates W and warm-starts the solver from the previous solution
+                W = cp.Parameter((Point.counter, Point.counter))
+                heuristic = cp.sum(cp.multiply(G, W))
+                prob = cp.Problem(objective=cp.Minimize(heuristic), constraints=self._list_of_cvxpy_constraints)
+                for solver_kwargs in list_of_solver_kwargs:
+                    solver_kwargs.setdefault("warm_start", True)
+
                 for i in range(1, 1+niter):
-                    W = np.linalg.inv(corrected_G_value + eig_regularization * np.eye(Point.counter))
-                    heuristic = cp.sum(cp.multiply(G, W))
-                    prob = cp.Problem(objective=cp.Minimize(heuristic), constraints=self._list_of_cvxpy_constraints)
-                    prob.solve(**kwargs)
+                    W.value = np.linalg.inv(corrected_G_value + eig_regularization * np.eye(Point.counter))
+                    self._solve_cvxpy_problem(prob, list_of_solver_kwargs, verbose=verbose)
 
                     # Store the actualized obtained value
                     wc_value = objective.value
@@ -622,6 +896,119 @@ class PEP(object):
             # Return the value of the minimal performance metric
             return wc_value
 
+    @staticmethod
+    def _choose_solver(lmi_size, dimension_reduction=False):
+        """
+        Choose the solver used when `solve` is called with `solver="auto"`.
+
+        Interior point methods reach high accuracy on small SDPs in much fewer iterations
+        than first order methods such as SCS. Hence, the solver is chosen in the following order:
+
+            - MOSEK, when installed,
+            - CLARABEL for small SDPs, when installed and when no dimension reduction is required,
+            - the default choice of CVXPY otherwise.
+
+        CLARABEL is not used along with a dimension reduction, as it often fails to solve the heuristic problems,
+        whose constraint on the worst-case value is nearly active.
+
+        Args:
+            lmi_size (int): the size of the main PSD matrix.
+            dimension_reduction (bool): whether a dimension reduction heuristic is used after the main solve.
+
+        Returns:
+            solver (str or None): the name of the chosen solver, or None to let CVXPY choose it.
+
+        """
+
+        installed_solvers = cp.installed_solvers()
+        if "MOSEK" in installed_solvers:
+            return "MOSEK"
+        elif lmi_size <= 20 and not dimension_reduction and "CLARABEL" in installed_solvers:
+            return "CLARABEL"
+        else:
+            return None
+
+    @staticmethod
+    def _solve_cvxpy_problem(prob, list_of_solver_kwargs, verbose=1):
+        """
+        Solve `prob` with the first solver that succeeds among the ones described in `list_of_solver_kwargs`.
+
+        A solver fails if it raises a `SolverError` or returns an inaccurate solution.
+        The last solver of the list is used whatever its outcome.
+
+        Args:
+            prob (cp.Problem): the SDP to solve.
+            list_of_solver_kwargs (list): a non empty list of dictionaries of keyword arguments of `prob.solve`,
+                                          each one describing a solver and its options, by order of preference.
+            verbose (int): Level of information details to print (Override the CVXPY solver verbose parameter).
+
+        """
+
+        for solver_kwargs in list_of_solver_kwargs[:-1]:
+
+            # Solve the problem, holding back the warnings of CVXPY in case the problem is solved again
+            with warnings.catch_warnings(record=True) as caught_warnings:
+                warnings.simplefilter("always")
+                try:
+                    prob.solve(**solver_kwargs)
+                    succeeded = prob.status not in cp.settings.INACCURATE
+                except cp.error.SolverError:
+                    succeeded = False
+
+            # Emit the warnings of a successful solve only
+            if succeeded:
+                for caught_warning in caught_warnings:
+                    warnings.warn_explicit(caught_warning.message, caught_warning.category,
+                                           caught_warning.filename, caught_warning.lineno)
+                return
+
+            if verbose:
+                print('(PEPit) Solver {} failed to solve the problem accurately,'
+                      ' falling back to the next solver'.format(solver_kwargs["solver"]))
+
+        prob.solve(**list_of_solver_kwargs[-1])
+
+    @staticmethod
+    def _add_accuracy_options(accuracy, kwargs, verbose=1):
+        """
+        Add the tolerances corresponding to `accuracy` to the options sent to the solver.
+
+        If no solver is specified, the default SDP solver of CVXPY is assumed,
+        i.e. MOSEK if installed, and SCS otherwise.
+
+        Args:
+            accuracy (str): "screening" or "tight".
+            kwargs (dict): the options sent to the solver, that have priority over the ones set by `accuracy`.
+            verbose (int): level of information details to print.
+
+        Returns:
+            kwargs (dict): the options sent to the solver, completed with the required tolerances.
+
+        Raises:
+            ValueError if `accuracy` is neither "default", nor "screening", nor "tight".
+
+        """
+
+        # Sanity check
+        if accuracy not in PEP._accuracy_options:
+            raise ValueError("The argument \'accuracy\' must be \'default\', \'screening\' or \'tight\'."
+                             " Got {}".format(accuracy))
+
+        # Find the solver that will be used
+        solver = kwargs.get("solver")
+        if solver is None:
+            solver = "MOSEK" if "MOSEK" in cp.installed_solvers() else "SCS"
+            kwargs["solver"] = solver
+
+        # Add the tolerances of this solver, unless explicitly specified
+        if solver.upper() in PEP._accuracy_options[accuracy]:
+            kwargs = {**PEP._accuracy_options[accuracy][solver.upper()], **kwargs}
+        elif verbose:
+            print("(PEPit) Accuracy {} is not available for solver {};"
+                  " the default tolerances of the solver are used.".format(accuracy, solver))
+
+        return kwargs
+
     @staticmethod
     def get_nb_eigenvalues_and_corrected_matrix(M):
         """
@@ -743,26 +1130,37 @@ class PEP(object):
 
         Raises:
             TypeError if the attribute `_list_of_constraints_sent_to_cvxpy` of this object
-            is neither a :class:`Constraint` object, nor a :class:`PSDMatrix` one.
+            is neither a :class:`Constraint` object, a list of :class:`Constraint` objects,
+            nor a :class:`PSDMatrix` one.
 
         """
         # Store residual, dual value of the main lmi
         self.residual = dual_values[0]
         assert self.residual.shape == (Point.counter, Point.counter)
 
-        # Set counter
-        counter = len(self.list_of_performance_metrics)+1
-
         # The dual variables associated to performance metric all have nonnegative values of sum 1.
         # Generally, only 1 performance metric is used.
         # Then its associated dual values is 1 while the others'associated dual values are 0.
-        performance_metric_dual_values = np.array(dual_values[1:counter])
-        position_of_minimal_objective = np.argmax(performance_metric_dual_values)
+        # Note all the performance metrics are sent to CVXPY as a single constraint.
+        if len(self.list_of_performance_metrics) > 0:
+            performance_metric_dual_values = np.array(dual_values[1]).reshape(-1)
+            position_of_minimal_objective = np.argmax(performance_metric_dual_values)
+            counter = 2
+        else:
+            position_of_minimal_objective = None
+            counter = 1
 
         for constraint_or_psd in self._list_of_constraints_sent_to_cvxpy:
             if isinstance(constraint_or_psd, Constraint):
                 constraint_or_psd._dual_variable_value = dual_values[counter]
                 counter += 1
+            elif isinstance(constraint_or_psd, list):
+                # A list of constraints sent to CVXPY as a single vectorized constraint
+                block_dual_values = np.array(dual_values[counter]).reshape(-1)
+                assert block_dual_values.shape == (len(constraint_or_psd),)
+                for constraint, dual_value in zip(constraint_or_psd, block_dual_values):
+                    constraint._dual_variable_value = float(dual_value)
+                counter += 1
             elif isinstance(constraint_or_psd, PSDMatrix):
                 assert dual_values[counter].shape == constraint_or_psd.shape
                 constraint_or_psd._dual_variable_value = dual_values[counter]
@@ -773,7 +1171,8 @@ class PEP(object):
                 counter += size
             else:
                 raise TypeError("The list of constraints that are sent to CVXPY should contain only"
-                                "\'Constraint\' objects of \'PSDMatrix\' objects."
+                                "\'Constraint\' objects, lists of \'Constraint\' objects"
+                                " or \'PSDMatrix\' objects."
                                 "Got {}".format(type(constraint_or_psd)))
 
         # Verify nothing is left
@@ -2,7 +2,7 @@ import numpy as np
 
 from PEPit.expression import Expression
 
-from PEPit.tools.dict_operations import merge_dict, prune_dict, multiply_dicts
+from PEPit.tools.dict_operations import merge_dict, subtract_dict, prune_dict, multiply_dicts
 
 
 class Point(object):
@@ -150,8 +150,16 @@ class Point(object):
 
         """
 
-        # A-B = A+(-B)
-        return self.__add__(-other)
+        # Verify that other is a Point
+        assert isinstance(other, Point)
+
+        # Update the linear decomposition of the difference of 2 points from their respective leaf decomposition.
+        # Note it avoids building the intermediate Point -other.
+        subtracted_decomposition_dict = subtract_dict(self.decomposition_dict, other.decomposition_dict)
+        subtracted_decomposition_dict = prune_dict(subtracted_decomposition_dict)
+
+        # Create and return the newly created Point that cannot be a leaf, by definition
+        return Point(is_leaf=False, decomposition_dict=subtracted_decomposition_dict)
 
     def __neg__(self):
         """
@@ -1,7 +1,11 @@
-from .dict_operations import merge_dict, prune_dict, multiply_dicts
+from .dict_operations import merge_dict, subtract_dict, prune_dict, multiply_dicts
+from .parallel_sweep import sweep
 
 __all__ = ['dict_operations',
+           'parallel_sweep',
            'merge_dict',
+           'subtract_dict',
            'prune_dict',
            'multiply_dicts',
+           'sweep',
            ]
@@ -16,22 +16,56 @@ def merge_dict(dict1, dict2):
     merged_dict = dict1.copy()
 
     # Add all key of dict2 to dict1
-    for key in dict2.keys():
+    for key, value in dict2.items():
 
         # If in both, the values are added
-        if key in dict1.keys():
+        if key in merged_dict:
 
-            merged_dict[key] += dict2[key]
+            merged_dict[key] += value
 
         # Otherwise, just add the new key and value
         else:
 
-            merged_dict[key] = dict2[key]
+            merged_dict[key] = value
 
     # Return the merged dict
     return merged_dict
 
 
+def subtract_dict(dict1, dict2):
+    """
+    Merge keys of dict1 and dict2.
+    If a key is in the 2 dictionaries, then subtract the value of dict2 from the one of dict1.
+
+    Args:
+        dict1 (dict): any dictionary
+        dict2 (dict): any dictionary
+
+    Returns:
+        subtracted_dict (dict): the union of the 2 inputs with subtracted values.
+
+    """
+
+    # Start from dict1
+    subtracted_dict = dict1.copy()
+
+    # Subtract all key of dict2 from dict1
+    for key, value in dict2.items():
+
+        # If in both, the values are subtracted
+        if key in subtracted_dict:
+
+            subtracted_dict[key] -= value
+
+        # Otherwise, just add the new key and the opposite of its value
+        else:
+
+            subtracted_dict[key] = - value
+
+    # Return the subtracted dict
+    return subtracted_dict
+
+
 def prune_dict(my_dict):
     """
     Remove all keys associated to a null value.
@@ -44,15 +78,8 @@ def prune_dict(my_dict):
 
     """
 
-    # Start from empty dict
-    pruned_dict = dict()
-
-    # Add all entry of dict1 that does not have a null value
-    for key in my_dict.keys():
-
-        if my_dict[key] != 0:
-
-            pruned_dict[key] = my_dict[key]
+    # Keep all entries of my_dict that do not have a null value
+    pruned_dict = {key: value for key, value in my_dict.items() if value != 0}
 
     # Return pruned dict
     return pruned_dict
@@ -72,19 +99,12 @@ def multiply_dicts(dict1, dict2):
 
     """
 
-    # Start from empty dict
-    product_dict = dict()
-
-    # Complete the dict
-    for key1 in dict1.keys():
-        for key2 in dict2.keys():
-            product_key = (key1, key2)
-            product_value = dict1[key1] * dict2[key2]
-
-            if product_key in product_dict.keys():
-                product_dict[product_key] += product_value
-            else:
-                product_dict[product_key] = product_value
+    # Build the dict.
+    # Since the keys of each input are distinct, all the couples of keys are distinct too,
+    # hence each product can be directly stored without checking whether its key already exists.
+    product_dict = {(key1, key2): value1 * value2
+                    for key1, value1 in dict1.items()
+                    for key2, value2 in dict2.items()}
 
     # Return the product dict
     return product_dict
@@ -0,0 +1,61 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+
+def _call_with_kwargs(wc_function, kwargs):
+    """
+    Call `wc_function` with keyword arguments `kwargs`.
+
+    Args:
+        wc_function (callable): any function.
+        kwargs (dict): the keyword arguments of `wc_function`.
+
+    Returns:
+        the output of `wc_function`.
+
+    """
+
+    return wc_function(**kwargs)
+
+
+def sweep(wc_function, list_of_kwargs, n_jobs=None):
+    """
+    Evaluate a worst-case guarantee on a grid of parameters, each evaluation being run in its own process.
+
+    Each PEP is independent from the others, but PEPit stores the PEP under construction in class attributes,
+    hence PEPs cannot be built concurrently within a single process.
+    The evaluations are therefore dispatched to a pool of processes.
+
+    Args:
+        wc_function (callable): a function computing a worst-case guarantee,
+                                typically the `wc_` function of an example.
+                                It must be defined at the top level of a module to be sent to other processes.
+        list_of_kwargs (list): a list of dictionaries, each one containing the keyword arguments
+                               of one call to `wc_function`.
+                               The argument `verbose` is overwritten to -1 to avoid interleaved prints.
+        n_jobs (int, optional): the number of processes. Set to None (default) to use all the available CPUs,
+                                or to 1 to run all the evaluations sequentially in the current process.
+
+    Returns:
+        list: the outputs of `wc_function`, in the order of `list_of_kwargs`.
+
+    Example:
+        >>> from PEPit.examples.unconstrained_convex_minimization import wc_gradient_descent
+        >>> list_of_kwargs = [{"L": 1, "gamma": gamma, "n": 4} for gamma in [.5, 1., 1.5]]
+        >>> outputs = sweep(wc_gradient_descent, list_of_kwargs)
+
+    """
+
+    # Silence each evaluation
+    list_of_kwargs = [dict(kwargs, verbose=-1) for kwargs in list_of_kwargs]
+
+    # Run all the evaluations sequentially if required
+    if n_jobs == 1:
+        return [wc_function(**kwargs) for kwargs in list_of_kwargs]
+
+    # Otherwise, run them in a pool of processes
+    with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+        outputs = list(executor.map(partial(_call_with_kwargs, wc_function), list_of_kwargs))
+
+    # Return the outputs in the order of the inputs
+    return outputs
@@ -14,7 +14,7 @@ setuptools.setup(
                 "to pep their optimization algorithms as easily as they implement them",
     long_description=long_description,
     long_description_content_type="text/markdown",
-    install_requires=["cvxpy>=1.1.17"],
+    install_requires=["cvxpy>=1.1.17", "numpy", "scipy"],
     url="https://github.com/PerformanceEstimation/PEPit",
     project_urls={
         "Documentation": "https://pepit.readthedocs.io/en/{}/".format(version),
@@ -25,6 +25,6 @@ setuptools.setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
     ],
-    packages=[element for element in setuptools.find_packages() if element[:5] == 'PEPit'],
+    packages=setuptools.find_packages(include=["PEPit", "PEPit.*"]),
     python_requires=">=3.6",
 )
@@ -57,3 +57,22 @@ class TestConstraintsBlockSmoothConvex(unittest.TestCase):
         self.assertEqual(len(self.func1.list_of_class_constraints), 6)
         self.assertEqual(len(self.func2.list_of_class_constraints), 6)
         self.assertEqual(len(self.func3.list_of_class_constraints), 18)
+
+    def test_partition_constraints_are_not_duplicated(self):
+        problem = PEP()
+        partition = problem.declare_block_partition(d=3)
+        func = problem.declare_function(BlockSmoothConvexFunction, L=self.L3, partition=partition)
+
+        xs = func.stationary_point()
+        x0 = problem.set_initial_point()
+        x1 = x0 - 1 / self.L3[0] * partition.get_block(func.gradient(x0), 0)
+        problem.set_initial_condition(func(x0) - func(xs) <= 1)
+        problem.set_performance_metric(func(x1) - func(xs))
+
+        problem.solve(verbose=0)
+        nb_partition_constraints = len(partition.list_of_constraints)
+
+        # Solving again after adding an initial condition must not add the partition constraints twice
+        problem.set_initial_condition((x0 - xs) ** 2 <= 1)
+        problem.solve(verbose=0)
+        self.assertEqual(len(partition.list_of_constraints), nb_partition_constraints)
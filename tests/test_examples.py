@@ -5,6 +5,7 @@ import numpy as np
 from PEPit.examples.unconstrained_convex_minimization import wc_conjugate_gradient
 from PEPit.examples.unconstrained_convex_minimization import wc_conjugate_gradient_qg_convex
 from PEPit.examples.unconstrained_convex_minimization import wc_gradient_descent
+from PEPit.examples.unconstrained_convex_minimization.gradient_descent_quadratics import wc_gradient_descent_quadratics
 from PEPit.examples.unconstrained_convex_minimization import wc_gradient_descent_qg_convex
 from PEPit.examples.unconstrained_convex_minimization import wc_gradient_descent_qg_convex_decreasing
 from PEPit.examples.unconstrained_convex_minimization import wc_subgradient_method_rsi_eb
@@ -134,6 +135,20 @@ class TestExamples(unittest.TestCase):
         wc, theory = wc_gradient_descent(L, gamma, n, verbose=self.verbose)
         self.assertAlmostEqual(wc, theory, delta=self.relative_precision * theory)
 
+    def test_gradient_descent_auto_solver(self):
+        L, n = 3, 4
+        gamma = 1 / L
+
+        wc, theory = wc_gradient_descent(L, gamma, n, verbose=self.verbose, solver="auto")
+        self.assertAlmostEqual(wc, theory, delta=self.relative_precision * theory)
+
+    def test_gradient_descent_quadratics(self):
+        mu, L, n = 0.1, 1., 4
+        gamma = 1 / L
+
+        wc, theory = wc_gradient_descent_quadratics(mu, L, gamma, n, verbose=self.verbose)
+        self.assertAlmostEqual(wc, theory, delta=self.relative_precision * theory)
+
     def test_cyclic_coordinate_descent_one_block(self):
         n = 9
         L = 1.
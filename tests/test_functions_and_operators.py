@@ -184,3 +184,11 @@ class TestFunctionsAndOperators(unittest.TestCase):
         self.assertEqual(len(self.operator6.list_of_class_constraints), num_points_eval * (num_points_eval - 1) / 2)
         self.assertEqual(len(self.operator7.list_of_class_constraints), num_points_eval * (num_points_eval - 1) / 2)
         self.assertEqual(len(self.new_operator.list_of_class_constraints), 0)
+
+    def test_smooth_strongly_convex_function_with_mu_equal_L_on_a_single_point(self):
+
+        # Interpolation conditions involve pairs of points only, hence mu == L is allowed on a single point
+        func = SmoothStronglyConvexFunction(mu=1, L=1)
+        func.gradient(Point())
+        func.add_class_constraints()
+        self.assertEqual(len(func.list_of_class_constraints), 0)
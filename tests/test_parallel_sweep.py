@@ -0,0 +1,26 @@
+import unittest
+
+from PEPit.tools.parallel_sweep import sweep
+from PEPit.examples.unconstrained_convex_minimization import wc_gradient_descent
+
+
+class TestSweep(unittest.TestCase):
+
+    def setUp(self):
+
+        self.list_of_kwargs = [{"L": 1, "gamma": gamma, "n": 2} for gamma in [.5, 1.]]
+        self.relative_precision = 10 ** -3
+
+    def test_sweep_sequential(self):
+
+        outputs = sweep(wc_gradient_descent, self.list_of_kwargs, n_jobs=1)
+        for pepit_tau, theoretical_tau in outputs:
+            self.assertAlmostEqual(pepit_tau, theoretical_tau, delta=theoretical_tau * self.relative_precision)
+
+    def test_sweep_parallel(self):
+
+        sequential_outputs = sweep(wc_gradient_descent, self.list_of_kwargs, n_jobs=1)
+        parallel_outputs = sweep(wc_gradient_descent, self.list_of_kwargs, n_jobs=2)
+        self.assertEqual(len(parallel_outputs), len(self.list_of_kwargs))
+        for (pepit_tau, _), (parallel_pepit_tau, _) in zip(sequential_outputs, parallel_outputs):
+            self.assertAlmostEqual(pepit_tau, parallel_pepit_tau, delta=pepit_tau * self.relative_precision)
@@ -6,6 +6,7 @@ from PEPit.point import Point
 from PEPit.expression import Expression
 from PEPit.function import Function
 from PEPit.functions.smooth_strongly_convex_function import SmoothStronglyConvexFunction
+from PEPit.operators.linear import LinearOperator
 from PEPit.primitive_steps import inexact_gradient_step
 
 
@@ -56,6 +57,145 @@ class TestPEP(unittest.TestCase):
         self.assertEqual(Expression.counter, 2)
         self.assertEqual(Function.counter, 1)
 
+    def test_class_constraints_are_reused(self):
+
+        self.problem.solve(verbose=0)
+        list_of_class_constraints = self.func.list_of_class_constraints
+        self.assertEqual(len(list_of_class_constraints), 2)
+
+        # Solving the same problem again does not generate interpolation constraints again
+        self.problem.solve(verbose=0)
+        self.assertIs(self.func.list_of_class_constraints, list_of_class_constraints)
+        self.assertEqual(len(self.func.list_of_class_constraints), 2)
+
+        # The weights of the interpolation constraints computed during the first solve are reused
+        list_of_sparse_weights = [constraint.expression._sparse_weights for constraint in list_of_class_constraints]
+        self.assertNotIn(None, list_of_sparse_weights)
+        self.problem.solve(verbose=0)
+        for constraint, sparse_weights in zip(self.func.list_of_class_constraints, list_of_sparse_weights):
+            self.assertIs(constraint.expression._sparse_weights, sparse_weights)
+
+        # Evaluating the function on a new point requires new interpolation constraints
+        self.func.gradient(self.x1)
+        self.problem.solve(verbose=0)
+        self.assertEqual(len(self.func.list_of_class_constraints), 6)
+
+    def test_class_constraints_of_linear_operator_are_updated(self):
+
+        # Evaluate a linear operator and its transpose
+        problem = PEP()
+        M = problem.declare_function(LinearOperator, L=1., second_list_of_points=list())
+        x0 = problem.set_initial_point()
+        u0 = problem.set_initial_point()
+        u1 = problem.set_initial_point()
+        problem.set_initial_condition(x0 ** 2 <= 1)
+        problem.set_initial_condition(u0 ** 2 <= 1)
+        problem.set_initial_condition(u1 ** 2 <= 1)
+        y0 = M.gradient(x0)
+        v0 = M.gradient_transpose(u0)
+        problem.set_performance_metric(x0 * v0 - y0 * u0)
+        self.assertAlmostEqual(problem.solve(verbose=0), 0, delta=10 ** -4)
+
+        # Evaluating only the transpose on a new point requires new interpolation constraints
+        v1 = M.gradient_transpose(u1)
+        problem.list_of_performance_metrics = list()
+        problem.set_performance_metric(x0 * v1 - y0 * u1)
+        self.assertAlmostEqual(problem.solve(verbose=0), 0, delta=10 ** -4)
+        self.assertEqual(len(M.list_of_class_constraints), 2)
+
+    def test_scalar_constraints_are_sent_in_blocks(self):
+
+        self.problem.add_constraint(self.func(self.x0) == self.func(self.x1))
+        self.problem.solve(verbose=0)
+
+        # Main LMI, performance metric, a block of inequalities and a block of equalities
+        self.assertEqual(len(self.problem._list_of_cvxpy_constraints), 4)
+        self.assertEqual([len(block) for block in self.problem._list_of_constraints_sent_to_cvxpy], [7, 1])
+
+        for constraint in self.problem.list_of_constraints + self.func.list_of_class_constraints:
+            self.assertIsInstance(constraint._dual_variable_value, float)
+
+    def test_cvxpy_problem_is_reused(self):
+
+        # Solving the same PEP again solves the same cvxpy problem
+        prob = self.problem.solve(verbose=0, return_full_cvxpy_problem=True)
+        self.assertIs(self.problem.solve(verbose=0, return_full_cvxpy_problem=True), prob)
+        self.assertAlmostEqual(prob.value, self.theoretical_tau, delta=10 ** -4)
+
+        # Solving it again with a tighter accuracy starts from the previous solution
+        self.problem.solve(verbose=0, accuracy="tight", return_full_cvxpy_problem=True, warm_start=False)
+        nb_iterations_cold_start = prob.solver_stats.num_iters
+        self.problem.solve(verbose=0, accuracy="screening")
+        self.problem.solve(verbose=0, accuracy="tight")
+        self.assertLessEqual(prob.solver_stats.num_iters, nb_iterations_cold_start)
+        for constraint in self.problem.list_of_constraints + self.func.list_of_class_constraints:
+            self.assertIsInstance(constraint.eval_dual(), float)
+
+        # Adding a constraint leads to a new cvxpy problem
+        self.problem.add_constraint(self.func(self.x0) <= 10)
+        self.assertIsNot(self.problem.solve(verbose=0, return_full_cvxpy_problem=True), prob)
+
+    def test_cvxpy_problem_is_not_reused_after_replacing_a_metric(self):
+
+        pepit_tau = self.problem.solve(verbose=0)
+
+        # Replacing the performance metric in place leads to a new cvxpy problem
+        self.problem.list_of_performance_metrics[0] = 100 * ((self.x1 - self.xs) ** 2)
+        self.assertAlmostEqual(self.problem.solve(verbose=0), 100 * pepit_tau, delta=10 ** -2)
+
+    def test_accuracy(self):
+
+        # A screening solve is accurate enough to compare parameters, and a tight one matches the theory
+        pepit_tau_screening = self.problem.solve(verbose=0, accuracy="screening")
+        self.assertAlmostEqual(pepit_tau_screening, self.theoretical_tau, delta=10 ** -2)
+        pepit_tau_tight = self.problem.solve(verbose=0, accuracy="tight")
+        self.assertAlmostEqual(pepit_tau_tight, self.theoretical_tau, delta=10 ** -5)
+
+        # Explicit solver options have priority over the ones set by accuracy
+        kwargs = PEP._add_accuracy_options("screening", {"solver": "SCS", "eps_abs": 1e-6})
+        self.assertEqual(kwargs, {"solver": "SCS", "eps_abs": 1e-6, "eps_rel": 1e-4, "max_iters": 2500})
+
+        self.assertRaises(ValueError, self.problem.solve, verbose=0, accuracy="unknown")
+
+    def test_auto_solver(self):
+
+        # The solver chosen by PEPit gives the same value, with or without dimension reduction
+        pepit_tau = self.problem.solve(verbose=0, solver="auto")
+        self.assertAlmostEqual(pepit_tau, self.theoretical_tau, delta=10 ** -4)
+        pepit_tau = self.problem.solve(verbose=0, solver="auto", dimension_reduction_heuristic="logdet2")
+        self.assertAlmostEqual(pepit_tau, self.theoretical_tau, delta=10 ** -4)
+        pepit_tau = self.problem.solve(verbose=0, solver="auto", dimension_reduction_heuristic="trace")
+        self.assertAlmostEqual(pepit_tau, self.theoretical_tau, delta=10 ** -4)
+
+        # A solver that does not solve the problem accurately is replaced by the next one
+        prob = self.problem.solve(verbose=0, return_full_cvxpy_problem=True)
+        PEP._solve_cvxpy_problem(prob, [{"solver": "SCS", "max_iters": 1}, {"solver": "SCS"}], verbose=0)
+        self.assertEqual(prob.status, "optimal")
+        self.assertAlmostEqual(prob.value, self.theoretical_tau, delta=10 ** -4)
+
+    def test_reset(self):
+
+        pepit_tau = self.problem.solve(verbose=0)
+
+        # After a reset, the PEP is empty
+        self.problem.reset()
+        self.assertEqual(len(self.problem.list_of_functions), 0)
+        self.assertEqual(len(self.problem.list_of_points), 0)
+        self.assertEqual(len(self.problem.list_of_constraints), 0)
+        self.assertEqual(len(self.problem.list_of_performance_metrics), 0)
+        self.assertEqual(Point.counter, 0)
+        self.assertEqual(Expression.counter, 0)
+        self.assertEqual(Function.counter, 0)
+
+        # Describing the same problem again leads to the same worst-case guarantee
+        func = self.problem.declare_function(SmoothStronglyConvexFunction, mu=self.mu, L=self.L)
+        xs = func.stationary_point()
+        x0 = self.problem.set_initial_point()
+        self.problem.set_initial_condition((x0 - xs) ** 2 <= 1)
+        x1 = x0 - self.gamma * func.gradient(x0)
+        self.problem.set_performance_metric((x1 - xs) ** 2)
+        self.assertAlmostEqual(self.problem.solve(verbose=0), pepit_tau, delta=10 ** -4)
+
     def test_eval_points_and_function_values(self):
 
         self.problem.solve(verbose=0)
@@ -175,3 +315,8 @@ class TestPEP(unittest.TestCase):
         # the solve method returns the worst-case performance, not the chosen heuristic value.
         pepit_tau3 = self.problem.solve(verbose=0, dimension_reduction_heuristic="logdet2")
         self.assertAlmostEqual(pepit_tau3, pepit_tau, delta=10 ** -2)
+
+        # Verify that the log det heuristic is skipped since the worst-case Gram matrix has already rank 1,
+        # hence the returned problem is the PEP itself.
+        prob3 = self.problem.solve(verbose=0, return_full_cvxpy_problem=True, dimension_reduction_heuristic="logdet2")
+        self.assertAlmostEqual(prob3.value, pepit_tau, delta=10 ** -2)